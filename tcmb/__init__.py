@@ -1,3 +1,3 @@
-from tcmb.core import Client, read
+from tcmb.core import Client, aread, read
 
 __version__ = "0.4.1"
@@ -1,44 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import json
 import os.path
+import sys
+
+from tcmb import _json
+
+
+@lru_cache(maxsize=1)
+def _load_series_json() -> tuple:
+    """Load the series codes of the datagroups from the package resources.
+
+    The file is read and decoded once per process.
+
+    Returns
+    -------
+    A tuple of
+    - tuple of the series codes of all datagroups
+    - dict of datagroup code: list of series codes
+    """
+    file_path = os.path.join(os.path.dirname(__file__), "resources", "series.json")
+
+    with open(file_path, "rb") as file:
+        dg_series = _json.loads(file.read())
+
+    # intern the codes so that the datagroup lists and the flat tuple
+    # share the same string objects and comparisons are by identity first
+    dg_series = {
+        dg_code: [sys.intern(item) for item in items]
+        for dg_code, items in dg_series.items()
+    }
+    series = tuple(item for items in dg_series.values() for item in items)
+
+    return series, dg_series
 
 
 def read_package_data() -> list:
     """Read series codes from the package resources."""
-    file_path = os.path.join(os.path.dirname(__file__), "resources", "series.json")
+    series, _ = _load_series_json()
 
-    with open(file_path, "r") as file:
-        dg_series = json.load(file)
+    return list(series)
 
-    series_list = []
 
-    for item in dg_series.values():
-        series_list.extend(item)
+def _get_dg_series_codes(client, dg_code: str) -> list:
+    """Get series codes of a datagroup."""
+    series_metadata = client.get_series_metadata(datagroup=dg_code)
 
-    return series_list
+    if isinstance(series_metadata, dict):
+        series_metadata = [series_metadata]
 
+    return [item["SERIE_CODE"] for item in series_metadata]
 
-def fetch_dg_series_codes() -> dict:
-    """Get series codes for each datagroup."""
-    from tcmb import Client
 
-    client = Client()
-    dg_codes = [dg["DATAGROUP_CODE"] for dg in client.datagroups]
+def fetch_dg_series_codes(max_workers: int = 16) -> dict:
+    """Get series codes for each datagroup.
+
+    The metadata of the datagroups are requested concurrently
+    over the pooled connections of the client session.
 
-    # There are 439 data groups as of 2023-04-25
-    print(f"There are {len(dg_codes)} items in total.")
+    Parameters
+    ----------
+    max_workers:
+        Maximum number of concurrent requests.
+    """
+    from tcmb import Client
 
-    dg_series = {}
-    for dg_code in dg_codes:
-        series_codes = []
-        series_metadata = client.get_series_metadata(datagroup=dg_code)
+    with Client() as client:
+        dg_codes = [dg["DATAGROUP_CODE"] for dg in client.datagroups]
 
-        if isinstance(series_metadata, dict):
-            series_metadata = [series_metadata]
+        # There are 439 data groups as of 2023-04-25
+        print(f"There are {len(dg_codes)} items in total.")
 
-        for item in series_metadata:
-            series_codes.append(item["SERIE_CODE"])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_get_dg_series_codes, client, dg_code): dg_code
+                for dg_code in dg_codes
+            }
+            results = {}
+            for count, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                print(f"{count}/{len(dg_codes)}", end="\r")
 
-        dg_series[dg_code] = series_codes
+    # keep the order of the datagroups
+    dg_series = {dg_code: results[dg_code] for dg_code in dg_codes}
 
     return dg_series
 
@@ -49,9 +93,16 @@ def _update_package_data():
     This function is to be used by the maintainer to syncronize
     package data with the current data available on EVDS Web Service.
     """
+    from tcmb import utils
+
     dg_series = fetch_dg_series_codes()
 
     file_path = os.path.join(os.path.dirname(__file__), "resources", "series.json")
 
     with open(file_path, "w") as file:
         json.dump(dg_series, file)
+
+    _load_series_json.cache_clear()
+    # the wildcard search indexes are built from the package data as well
+    utils._packed_package_series.cache_clear()
+    utils._package_series_index.cache_clear()
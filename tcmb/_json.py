@@ -0,0 +1,32 @@
+"""JSON decoding module.
+
+orjson is used to decode the responses if it is installed,
+otherwise the standard library json module is used.
+
+Large JSON objects are decoded incrementally if ijson is installed.
+"""
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# minimum size of the JSON objects to be decoded incrementally
+STREAM_MIN_SIZE = 512 * 1024
+
+
+def is_streamable(content: bytes) -> bool:
+    """Check if the content is a large JSON object to be decoded incrementally."""
+    return (
+        (ijson is not None)
+        and (len(content) > STREAM_MIN_SIZE)
+        and content.startswith(b"{")
+    )
@@ -1,21 +1,35 @@
 """Authentication module."""
 from __future__ import annotations
+from json import JSONDecodeError
 import re
 
 import requests
-from requests.exceptions import HTTPError, JSONDecodeError
+from requests.exceptions import HTTPError
 
+from tcmb import _json
 from tcmb.errors import ApiKeyError, InvalidSeriesCode
 
 
-def _extract_error_message(response):
+# body of the html error pages
+_BODY_RE = re.compile(rb"<body[^>]*>(.*?)</body>", re.DOTALL | re.IGNORECASE)
+
+# only the beginning of large error pages is searched
+_MAX_ERROR_PAGE_SIZE = 64 * 1024
+_ERROR_SEARCH_SIZE = 16 * 1024
+
+
+def _extract_error_message(response) -> str:
     """Extract error message from the html body"""
-    # Extract error message from the html body
-    pattern = r"<body>(.*?)</body>"
-    error_msgs = re.findall(pattern, str(response.content))
-    error_msg = error_msgs[0].strip("\\rn")
+    content = response.content or b""
+    if len(content) > _MAX_ERROR_PAGE_SIZE:
+        content = content[:_ERROR_SEARCH_SIZE]
+
+    # search the bytes and decode the matched body only
+    match = _BODY_RE.search(content)
+    if match is None:
+        return ""
 
-    return error_msg
+    return match.group(1).decode("utf-8", errors="replace").strip()
 
 
 def check_status(response):
@@ -37,8 +51,13 @@ def check_status(response):
                 "API key is invalid or wrong key. See error message for details."
             ) from err
     else:
+        # large JSON objects are decoded incrementally, see fetch.iter_items
+        if _json.is_streamable(response.content):
+            return
+
         try:
-            response.json()
+            # decode once, the result is reused by fetch.parse_json
+            response._parsed = _json.loads(response.content)
         except JSONDecodeError:
             if "error-title" in response.text:
                 raise InvalidSeriesCode()
@@ -47,28 +66,43 @@ def check_status(response):
                 raise
 
 
-def check_api_key(api_key: str | None = None) -> bool:
+def check_api_key(
+    api_key: str | None = None, session: requests.Session | None = None
+) -> list | dict:
     """Check API key.
 
     TCMB Web Service does not provide a way to check the api key.
     This function allows checking api key with the "categories"
     endpoint which doesn't reques a series key parameter.
+    The categories metadata is returned, so that the response
+    can be reused instead of requesting it again.
 
     Parameters
     ----------
     api_key:
+    session:
+        requests Session to send the request with. If None, the shared
+        session of the fetch module is used.
+
+    Returns
+    -------
+    Categories metadata.
     """
+    # imported here to avoid circular import, fetch module uses check_status
+    from tcmb import fetch
+
     if api_key is None:
         raise ApiKeyError("No API key provided.")
 
     headers = {"key": api_key}
 
-    res = requests.get(
-        "https://evds2.tcmb.gov.tr/service/evds/categories/type=json",
+    # get_response checks if authenticated
+    res = fetch.get_response(
+        params={"type": "json"},
         headers=headers,
+        endpoint="categories",
+        session=session,
         timeout=30,
     )
-    # check if authenticated
-    check_status(res)
 
-    return True
+    return fetch.parse_json(res)
@@ -1,16 +1,22 @@
+from types import MappingProxyType
+
 # freq_str : freq_id mapping
-FREQ_MAPPING = {
-    "D": 1,  # daily
-    "B": 2,  # business daily
-    "W-FRI": 3,  # weekly (friday)
-    "W": 3,  # weekly (friday)
-    "M": 5,  # monthly
-    "Q": 6,  # quarterly
-    "2Q": 7,  # semi-annual
-    "A": 8,  # annual
-    "Y": 8,  # annual
-}
+FREQ_MAPPING = MappingProxyType(
+    {
+        "D": 1,  # daily
+        "B": 2,  # business daily
+        "W-FRI": 3,  # weekly (friday)
+        "W": 3,  # weekly (friday)
+        "M": 5,  # monthly
+        "Q": 6,  # quarterly
+        "2Q": 7,  # semi-annual
+        "A": 8,  # annual
+        "Y": 8,  # annual
+    }
+)
 
-FREQUENCY_TR_MAPPING = {
-    "AYLIK": "M",
-}
+FREQUENCY_TR_MAPPING = MappingProxyType(
+    {
+        "AYLIK": "M",
+    }
+)
@@ -10,14 +10,88 @@ TR: https://evds2.tcmb.gov.tr/help/videos/EVDS_Web_Servis_Kullanim_Kilavuzu.pdf
 
 """
 from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from functools import cached_property
+from functools import cached_property, partial
 import os
+import threading
+import time
+from typing import TYPE_CHECKING
 
-import pandas as pd
+import requests
 
 from tcmb import const, auth, utils, fetch
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Metadata endpoints change at most daily. Parsed responses are cached
+# in the module level so that they are shared by the Client instances.
+METADATA_CACHE_TTL = 3600  # seconds
+METADATA_CACHE_MAXSIZE = 4096
+
+_metadata_cache: dict[tuple, tuple[float, dict | list]] = {}
+_metadata_cache_lock = threading.Lock()
+
+
+def _cache_metadata(key: tuple, json_data: dict | list, fetched_at: float):
+    """Save the parsed JSON response of a metadata endpoint to the cache."""
+    with _metadata_cache_lock:
+        # evict the oldest entry (dicts keep insertion order)
+        if key not in _metadata_cache and (
+            len(_metadata_cache) >= METADATA_CACHE_MAXSIZE
+        ):
+            del _metadata_cache[next(iter(_metadata_cache))]
+        _metadata_cache[key] = (fetched_at, json_data)
+
+
+def _copy_metadata(json_data: dict | list) -> dict | list:
+    """Copy a cached metadata response, so that callers cannot modify the cache.
+
+    The responses are a dict or a list of flat dicts.
+    """
+    if isinstance(json_data, list):
+        return [dict(item) if isinstance(item, dict) else item for item in json_data]
+    return dict(json_data)
+
+
+def clear_metadata_cache():
+    """Clear the cached responses of the metadata endpoints."""
+    with _metadata_cache_lock:
+        _metadata_cache.clear()
+
+
+# (date, "DD-MM-YYYY" string) of today, see _today_ddmmyyyy
+#   the tuple is replaced with one assignment, so that the threads never see
+#   a date with the string of another date
+_TODAY_CACHE: tuple = (None, "")
+
+
+def _today_ddmmyyyy() -> str:
+    """Get today's date in the "DD-MM-YYYY" format, formatted once per day."""
+    global _TODAY_CACHE
+
+    today = date.today()
+    cached = _TODAY_CACHE
+    if cached[0] != today:
+        cached = _TODAY_CACHE = (today, today.strftime("%d-%m-%Y"))
+
+    return cached[1]
+
+
+def _series_list(series: str | list[str]) -> list[str]:
+    """Get the list of series keys, expanding the wildcard patterns."""
+    if not isinstance(series, str):
+        return list(series)
+
+    # wildcard search if any of the following case
+    if ("*" in series) or ("?" in series) or (".." in series):
+        return utils.wildcard_search(series)
+
+    # series keys seperated by "-" as descibed in the api reference
+    return series.split("-")
+
 
 def read(
     series: str | list[str],
@@ -29,6 +103,8 @@ def read(
     seperator: str = ".",
     headers: dict | None = None,
     api_key: str | None = None,
+    session: requests.Session | None = None,
+    dtype: str = "float64",
     **kwargs,
 ) -> pd.DataFrame:
     """Read data from TCMB's EVDS Web Service.
@@ -84,6 +160,12 @@ def read(
         the api_key argument is not passed or it is not exported to the
         environment, ApiKeyError is raised. EVDS Web Service accepts API Key
         as a request header in the format {"key": api_key}.
+    session:
+        requests Session to send the request with. If None, the shared
+        session of the fetch module is used.
+    dtype:
+        Float dtype of the value columns, e.g. "float32" to halve the memory
+        usage when the precision of float32 is enough for the series.
     **kwargs:
         Keyword arguments passed to the request.
 
@@ -91,6 +173,11 @@ def read(
     -------
     df: Pandas DataFrame.
 
+    Raises
+    ------
+    ValueError:
+        If the frequency string is unknown.
+
     References
     ----------
     - https://evds2.tcmb.gov.tr/help/videos/EVDS_Web_Service_Usage_Guide.pdf
@@ -110,21 +197,17 @@ def read(
     """
     api_key = api_key or os.environ.get("TCMB_API_KEY")
 
-    # convert freq string to
+    # convert freq string to freq id, e.g. "M" or "AYLIK" -> 5
+    #   freq id and None are passed as they are
+    freq = const.FREQ_MAPPING.get(const.FREQUENCY_TR_MAPPING.get(freq, freq), freq)
     if isinstance(freq, str):
-        freq = const.FREQ_MAPPING[freq]
+        raise ValueError(f"Unknown frequency: {freq}")
 
-    # wildcard search if any of the following case
-    if isinstance(series, str):
-        if ("*" in series) or ("?" in series) or (".." in series):
-            series = utils.wildcard_search(series)
+    series = _series_list(series)
 
     # convert list to str seperated by "-"
     # as descibed in the api reference
-    if isinstance(series, list):
-        series_str = "-".join(series)
-    else:
-        series_str = series
+    series_str = "-".join(series)
 
     # convert list to str seperated by "-"
     if isinstance(agg, list):
@@ -139,7 +222,7 @@ def read(
     params = {
         "series": series_str,
         "startDate": start or "01-01-1970",
-        "endDate": end or date.today().strftime("%d-%m-%Y"),
+        "endDate": end or _today_ddmmyyyy(),
         "type": "json",  # csv, xml, json
         "aggregationTypes": agg,
         "formulas": formulas,
@@ -154,15 +237,42 @@ def read(
     elif "key" not in headers:
         headers["key"] = api_key
 
-    res = fetch.get_response(params=params, headers=headers)
+    res = fetch.get_response(params=params, headers=headers, session=session)
 
     # convert response JSON to DataFrame
     #   time series data is in the "items"
-    data = utils.to_dataframe(res.json()["items"], series=series)
+    data = utils.to_dataframe(
+        fetch.iter_items(res), series=series, dtype=dtype, seperator=seperator
+    )
 
     return data
 
 
+async def aread(series: str | list[str], **kwargs) -> pd.DataFrame:
+    """Read data from TCMB's EVDS Web Service asynchronously.
+
+    Takes the same arguments as `read`. The request is sent from a worker
+    thread over the pooled session, so that many series can be read
+    concurrently, e.g. using `asyncio.gather`.
+
+    Example
+    -------
+    import asyncio
+    import tcmb
+
+    async def main():
+        return await asyncio.gather(
+            tcmb.aread("TP.DK.USD.S.YTL"),
+            tcmb.aread("TP.DK.EUR.S.YTL"),
+        )
+
+    usd, eur = asyncio.run(main())
+    """
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(None, partial(read, series, **kwargs))
+
+
 class Client:
     """Base class for TCMB web service access.
 
@@ -177,10 +287,34 @@ class Client:
 
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.environ.get("TCMB_API_KEY")
-        auth.check_api_key(self.api_key)
+        # connections, cookies and default headers persist per client
+        self._session = fetch.create_session()
+        try:
+            categories = auth.check_api_key(self.api_key, session=self._session)
+        except Exception:
+            self._session.close()
+            raise
+
+        # the key is checked with the categories endpoint,
+        # the response is kept for get_categories_metadata
+        _cache_metadata(
+            self._metadata_cache_key("categories", {"type": "json"}),
+            categories,
+            fetched_at=time.monotonic(),
+        )
+
+    def close(self):
+        """Close the connections of the client session."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
-    @staticmethod
     def _get_response(
+        self,
         params: dict,
         headers: dict | None = None,
         endpoint: str | None = None,
@@ -212,11 +346,41 @@ class Client:
             headers=headers,
             endpoint=endpoint,
             proxies=proxies,
+            session=self._session,
             **kwargs,
         )
 
         return res
 
+    def _metadata_cache_key(self, endpoint: str, params: dict) -> tuple:
+        """Get the key of a metadata response in the cache."""
+        return (endpoint, self.api_key, frozenset(params.items()))
+
+    def _cached_get(self, endpoint: str, params: dict) -> dict | list:
+        """Get the parsed JSON response of a metadata endpoint using the cache.
+
+        Responses are cached for `METADATA_CACHE_TTL` seconds, keyed on the
+        endpoint, the API key and the request parameters. A copy of the
+        cached response is returned.
+        """
+        key = self._metadata_cache_key(endpoint, params)
+        now = time.monotonic()
+
+        with _metadata_cache_lock:
+            cached = _metadata_cache.get(key)
+        if cached is not None and now - cached[0] < METADATA_CACHE_TTL:
+            return _copy_metadata(cached[1])
+
+        # add api_key to request header
+        headers = {"key": self.api_key}
+
+        res = self._get_response(params=params, endpoint=endpoint, headers=headers)
+        json_data = fetch.parse_json(res)
+
+        _cache_metadata(key, json_data, fetched_at=now)
+
+        return _copy_metadata(json_data)
+
     def read(
         self,
         series: str | list[str],
@@ -228,6 +392,7 @@ class Client:
         seperator: str = ".",
         headers: dict | None = None,
         metadata: bool = False,
+        dtype: str = "float64",
         **kwargs,
     ) -> pd.DataFrame | dict:
         """Read data from TCMB's EVDS Web Service.
@@ -275,9 +440,12 @@ class Client:
             Delimiter to use.
         metadata:
             Whether to read metadata for the series. If True, get requests are
-            performed as many as the number of series keys passed. The metadata
+            performed as many as the number of unique series keys. The metadata
             can be accessed using the `.attrs` attribute of the pandas.DataFrame.
             e.g. df.attrs
+        dtype:
+            Float dtype of the value columns, e.g. "float32" to halve the
+            memory usage when the precision of float32 is enough for the series.
         **kwargs:
             Keyword arguments passed to the request.
 
@@ -293,6 +461,9 @@ class Client:
         -------
         df = client.read(["...", "..."])
         """
+        # resolve the series keys once for both the data and the metadata
+        series = _series_list(series)
+
         df = read(
             series=series,
             start=start,
@@ -303,6 +474,8 @@ class Client:
             seperator=seperator,
             headers=headers,
             api_key=self.api_key,
+            session=self._session,
+            dtype=dtype,
             **kwargs,
         )
 
@@ -310,25 +483,45 @@ class Client:
         # to the .attrs attribute of the DataFrame
         #   it can be accessed using attrs: e.g. "df.attrs"
         if metadata:
-            attrs: dict[str, dict] = {}
-            # TODO: update for the case of list of series
-            for series_item in series.split("-"):
-                attrs[series_item] = self.get_series_metadata(series_item)
+            # request each series key once, concurrently if there are many
+            series_keys = list(dict.fromkeys(series))
+            if len(series_keys) == 1:
+                series_metadata = [self.get_series_metadata(series_keys[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    series_metadata = list(
+                        executor.map(self.get_series_metadata, series_keys)
+                    )
+
+            attrs: dict[str, dict] = dict(zip(series_keys, series_metadata))
 
             df.attrs = attrs
 
         return df
 
+    async def aread(self, series: str | list[str], **kwargs) -> pd.DataFrame | dict:
+        """Read data from TCMB's EVDS Web Service asynchronously.
+
+        Takes the same arguments as `Client.read`. The request is sent from
+        a worker thread over the pooled session of the client, so that
+        many series can be read concurrently.
+
+        Example
+        -------
+        dfs = await asyncio.gather(
+            client.aread("TP.DK.USD.S.YTL"),
+            client.aread("TP.DK.EUR.S.YTL"),
+        )
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, partial(self.read, series, **kwargs))
+
     def get_categories_metadata(self):
         """Get the list of the metadata of all categories."""
         params = {"type": "json"}
 
-        # add api_key to request header
-        headers = {"key": self.api_key}
-
-        res = self._get_response(params=params, endpoint="categories", headers=headers)
-
-        return res.json()
+        return self._cached_get(endpoint="categories", params=params)
 
     def get_datagroups_metadata(
         self, mode: int = 0, code: str | int | None = None
@@ -366,18 +559,13 @@ class Client:
             "type": "json",
         }
 
-        # add api_key to request header
-        headers = {"key": self.api_key}
-
-        res = self._get_response(params=params, endpoint="datagroups", headers=headers)
-
-        json_data = res.json()
+        json_data = self._cached_get(endpoint="datagroups", params=params)
 
         # if no data (empty response)
         if not json_data:
             raise ValueError(
                 "No data on respose, check `mode` and `code` parameters.\n"
-                f"Response: {res.content}"
+                f"Response: {json_data}"
             )
 
         return json_data
@@ -417,12 +605,7 @@ class Client:
             "type": "json",
         }
 
-        # add api_key to request header
-        headers = {"key": self.api_key}
-
-        res = self._get_response(params=params, endpoint="serieList", headers=headers)
-
-        return res.json()
+        return self._cached_get(endpoint="serieList", params=params)
 
     @cached_property
     def categories(self):
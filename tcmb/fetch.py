@@ -1,12 +1,61 @@
 """Data fetching module."""
 from __future__ import annotations
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from urllib.parse import quote, urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from tcmb import auth
+from tcmb import _json, auth
 
 URL = "https://evds2.tcmb.gov.tr/service/evds"
 
+DEFAULT_HEADERS = {
+    "User-Agent": "tcmb-py",
+    "Accept": "application/json",
+}
+
+
+def create_session() -> requests.Session:
+    """Create a requests Session with a pooled and retrying HTTPS adapter.
+
+    Reusing the same session keeps the connections to the evds host alive,
+    so the TCP and TLS handshakes are not repeated for every request.
+
+    Throttled requests (429) are retried respecting the Retry-After header.
+
+    NOTE: evds responds with a 500 Internal Server Error for an invalid
+    API key as well. Therefore 500 is not retried.
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+
+    return session
+
+
+# module level session shared by the `read` function and `Client` instances
+_SESSION = create_session()
+
+
+def close_session():
+    """Close the connections of the shared session."""
+    _SESSION.close()
+
 
 def _create_uri(params: dict, endpoint: str | None = None) -> str:
     """Create URI using the params and the evds url.
@@ -26,17 +75,19 @@ def _create_uri(params: dict, endpoint: str | None = None) -> str:
         - "datagroups"
         - None
     """
-    if endpoint is not None:
-        endpoint = endpoint + "/"
-    else:
-        endpoint = ""
+    endpoint_seg = f"{endpoint}/" if endpoint else ""
 
-    # create query string
-    # NOTE: alternative -> urllib.parse.urlencode(params)
-    #       however, this keeps None values
-    query_str = "&".join([k + "=" + str(v) for k, v in params.items() if v is not None])
+    # create query string, None values are skipped
+    # series keys, dates and decimal seperator are kept as they are
+    #   the query string is a part of the path, where "+" is not a space,
+    #   therefore spaces are encoded as "%20" with quote
+    query_str = urlencode(
+        {k: v for k, v in params.items() if v is not None},
+        safe=".*-,",
+        quote_via=quote,
+    )
 
-    return f"{URL}/{endpoint}{query_str}"
+    return f"{URL}/{endpoint_seg}{query_str}"
 
 
 def get_response(
@@ -44,10 +95,16 @@ def get_response(
     headers: dict | None = None,
     endpoint: str | None = None,
     proxies: dict | None = None,
+    session: requests.Session | None = None,
+    no_cache: bool = False,
     **kwargs,
 ):
     """Get response.
 
+    Responses of the metadata endpoints are cached on disk. The cached
+    response is revalidated with a conditional request (ETag and
+    Last-Modified) and reused if the server responds 304 Not Modified.
+
     Parameters
     ----------
     params:
@@ -63,19 +120,147 @@ def get_response(
         - None
     proxies:
         Dictionary mapping protocol to the URL of the proxy.
+    session:
+        Session to send the request with. If None, the module level
+        session is used.
+    no_cache:
+        Whether to skip the on-disk cache of the metadata endpoints.
     kwargs:
         Optional keyword arguments that request takes.
     """
+    if session is None:
+        session = _SESSION
+
     # Create url for the get request
     #  NOTE: the official api does not use ? for query strings
     #  Therefore the parameters are added to the end of the url
     #  instead of passing to the get request as params
     url = _create_uri(params=params, endpoint=endpoint)
 
+    use_cache = (endpoint is not None) and (params.get("type") == "json")
+    use_cache = use_cache and not no_cache
+
+    # add validators of the cached response to the request headers
+    entry = _read_cache_entry(url) if use_cache else None
+    if entry is not None:
+        headers = dict(headers or {})
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
     # Get request
-    res = requests.get(url, headers=headers, proxies=proxies, **kwargs)
+    res = session.get(url, headers=headers, proxies=proxies, **kwargs)
+
+    if (entry is not None) and (res.status_code == 304):
+        res = _cached_response(res, entry)
 
     # Check status
     auth.check_status(res)
 
+    if use_cache and (res.status_code == 200):
+        _write_cache_entry(url, res)
+
     return res
+
+
+def _cache_dir() -> str:
+    """Get the directory of the on-disk cache.
+
+    Defaults to "~/.cache/tcmb". It can be changed with the
+    "TCMB_CACHE_DIR" environment variable.
+    """
+    return os.environ.get("TCMB_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "tcmb"
+    )
+
+
+def _cache_path(url: str) -> str:
+    """Get the path of the cache entry of the url."""
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    return os.path.join(_cache_dir(), f"{name}.json")
+
+
+def _read_cache_entry(url: str) -> dict | None:
+    """Read the cached response of the url, if any."""
+    try:
+        with open(_cache_path(url), "rb") as file:
+            return _json.loads(file.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_entry(url: str, response):
+    """Save the response with its validators, if the server sent any.
+
+    The cache is an optimization only, failing to write it is ignored.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    if not (etag or last_modified):
+        return
+
+    path = _cache_path(url)
+    try:
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": response.content.decode("utf-8"),
+            "fetched_at": time.time(),
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first, so that readers never see
+        # a partially written entry
+        #   the file name is unique, threads writing the same url do not
+        #   write into the same temporary file
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+    except (OSError, UnicodeDecodeError):
+        pass
+
+
+def _cached_response(response, entry: dict) -> requests.Response:
+    """Create a response with the cached body for a 304 Not Modified response."""
+    cached = requests.Response()
+    cached.status_code = 200
+    cached._content = entry["body"].encode("utf-8")
+    cached.encoding = "utf-8"
+    cached.headers = response.headers
+    cached.url = response.url
+    cached.request = response.request
+
+    return cached
+
+
+def parse_json(response):
+    """Get the decoded JSON body of the response.
+
+    The body is decoded once while checking the status of the response.
+    The decoded object is reused instead of calling `response.json()`.
+    """
+    try:
+        return response._parsed
+    except AttributeError:
+        return _json.loads(response.content)
+
+
+def iter_items(response):
+    """Iterate over the "items" of the JSON body of the response.
+
+    Large bodies are decoded incrementally using ijson, if it is installed.
+    Therefore the whole decoded document is not kept in memory.
+    """
+    if not hasattr(response, "_parsed") and _json.is_streamable(response.content):
+        return _json.ijson.items(
+            io.BytesIO(response.content), "items.item", use_float=True
+        )
+
+    return iter(parse_json(response)["items"])
@@ -1,18 +1,72 @@
 """Utilities module."""
 from __future__ import annotations
 
-import json
+from bisect import bisect_left
 import re
-import os.path
-from datetime import datetime
-
-
-import numpy as np
-import pandas as pd
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+import threading
+from typing import TYPE_CHECKING, Iterable
+
+from tcmb._data import _load_series_json, fetch_dg_series_codes
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# parsed "Tarih" values of the non daily series, shared across the calls
+#   (date format, date string): datetime64, the oldest entries are evicted first
+_DATE_CACHE: dict = {}
+_DATE_CACHE_MAXSIZE = 10_000
+_DATE_CACHE_LOCK = threading.Lock()
+
+# bound once, used by standardize_date for the dates that are not zero padded
+_strptime = datetime.strptime
+
+# date formats accepted for the `start` and `end` parameters
+#   (year first, seperator): date format
+_DATE_FORMATS = {
+    (False, "-"): "%d-%m-%Y",
+    (False, "."): "%d.%m.%Y",
+    (True, "-"): "%Y-%m-%d",
+    (True, "."): "%Y.%m.%d",
+}
+
+# date formats of the "Tarih" column in the json response
+#   alternatives are matched in one pass, the name of the matched group
+#   is the key of the date format
+_INDEX_DATE_RE = re.compile(
+    r"^(?:(?P<dmy>\d{1,2}-\d{1,2}-\d{4})"
+    r"|(?P<my>\d{1,2}-\d{4})"
+    r"|(?P<ym>\d{4}-\d{1,2})"
+    r"|(?P<y>\d{4}))$"
+)
+_INDEX_DATE_FORMATS = {
+    "dmy": "%d-%m-%Y",
+    "my": "%m-%Y",
+    "ym": "%Y-%m",
+    "y": "%Y",
+}
+
+
+def _detect_date_format(date_str: str) -> str:
+    """Detect the date format by the position of the seperator characters.
+
+    The year is either the first or the last four digits, e.g. "YYYY-M-D" or
+    "D-M-YYYY", therefore the seperator after or before it is checked.
+    The rest of the string is validated when parsing with the format.
+    """
+    if len(date_str) >= 8:
+        if date_str[4] in "-." and date_str[:4].isdigit():
+            return _DATE_FORMATS[(True, date_str[4])]
+        if date_str[-5] in "-." and date_str[-4:].isdigit():
+            return _DATE_FORMATS[(False, date_str[-5])]
 
-from tcmb._data import fetch_dg_series_codes
+    raise ValueError(f"Unknown date format: {date_str}")
 
 
+@lru_cache(maxsize=512)
 def standardize_date(date_str: str) -> str:
     """Standardize date string format to output DD-MM-YYYY.
 
@@ -33,22 +87,203 @@ def standardize_date(date_str: str) -> str:
     -------
     date_str:
         Date string in the "DD-MM-YYYY" format.
+
+    Raises
+    ------
+    ValueError:
+        If the date string is not in one of the formats above.
+    """
+    # already in the target format, only the date is validated
+    if (
+        len(date_str) == 10
+        and date_str[2] == date_str[5] == "-"
+        and date_str.replace("-", "").isdigit()
+    ):
+        date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+        return date_str
+
+    date_format = _detect_date_format(date_str)
+
+    # zero padded dates are rearranged by slicing, e.g. YYYY-MM-DD
+    #   the other seperator is already checked by _detect_date_format
+    if len(date_str) == 10:
+        if date_format.startswith("%Y"):
+            year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+            sep = date_str[7]
+        else:
+            day, month, year = date_str[:2], date_str[3:5], date_str[6:]
+            sep = date_str[2]
+
+        if sep == date_format[2] and (day + month + year).isdigit():
+            # validate the date
+            date(int(year), int(month), int(day))
+            return f"{day}-{month}-{year}"
+
+    return _strptime(date_str, date_format).strftime("%d-%m-%Y")
+
+
+def _detect_index_format(date_str: str) -> str:
+    """Detect the date format of the "Tarih" column in the json response."""
+    # daily and weekly series, the most common case, e.g. "02-01-2024"
+    if len(date_str) == 10 and date_str[2] == "-" and date_str[5] == "-":
+        return "%d-%m-%Y"
+
+    match = _INDEX_DATE_RE.match(date_str)
+    if match is None:
+        raise ValueError(f"Unknown date format: {date_str}")
+
+    return _INDEX_DATE_FORMATS[match.lastgroup]
+
+
+def _parse_daily_dates(dates: list):
+    """Parse zero padded "DD-MM-YYYY" date strings with integer arithmetic.
+
+    The digits are read from the code points of a fixed width unicode
+    array, and composed into datetime64 values without parsing each
+    string. Returns None if any of the strings is not in this form.
+    """
+    import numpy as np
+
+    chars = np.array(dates, dtype=str)
+    if chars.dtype.itemsize != 10 * 4:
+        return None
+
+    codes = chars.view(np.uint32).reshape(-1, 10).astype(np.int64) - ord("0")
+    digits = codes[:, [0, 1, 3, 4, 6, 7, 8, 9]]
+    if not (
+        ((digits >= 0) & (digits <= 9)).all()
+        and (codes[:, [2, 5]] == ord("-") - ord("0")).all()
+    ):
+        return None
+
+    day = codes[:, 0] * 10 + codes[:, 1]
+    month = codes[:, 3] * 10 + codes[:, 4]
+    year = codes[:, 6] * 1000 + codes[:, 7] * 100 + codes[:, 8] * 10 + codes[:, 9]
+
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    days = months.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+
+    # invalid days, e.g. 31-02-2024, overflow to the next month
+    if not (
+        ((month >= 1) & (month <= 12) & (day >= 1)).all()
+        and (days.astype("datetime64[M]") == months).all()
+    ):
+        return None
+
+    return days.astype("datetime64[ns]")
+
+
+def _to_datetime_cached(dates: list, date_format: str):
+    """Convert date strings to a DatetimeIndex, memoized across the calls.
+
+    Only the strings that are not in `_DATE_CACHE` are parsed.
+    """
+    import numpy as np
+    import pandas as pd
+
+    with _DATE_CACHE_LOCK:
+        unique = {d: _DATE_CACHE.get((date_format, d)) for d in dict.fromkeys(dates)}
+    missing = [d for d, value in unique.items() if value is None]
+    if missing:
+        # parsed without holding the lock
+        parsed = pd.to_datetime(missing, format=date_format, cache=True).to_numpy()
+        unique.update(zip(missing, parsed))
+
+        with _DATE_CACHE_LOCK:
+            for d, value in zip(missing, parsed):
+                key = (date_format, d)
+                if key not in _DATE_CACHE and len(_DATE_CACHE) >= _DATE_CACHE_MAXSIZE:
+                    # dicts keep the insertion order
+                    del _DATE_CACHE[next(iter(_DATE_CACHE))]
+                _DATE_CACHE[key] = value
+
+    values = np.array([unique[d] for d in dates], dtype="datetime64[ns]")
+
+    return pd.DatetimeIndex(values)
+
+
+def _to_float(values: list, seperator: str = "."):
+    """Convert values of a column to a float array.
+
+    None and empty strings are converted to NaN. The decimal seperator
+    of the values is replaced with ".". Other values that cannot be
+    converted to float raise ValueError.
+    """
+    import numpy as np
+
+    try:
+        return np.fromiter(values, dtype=np.float64, count=len(values))
+    except (TypeError, ValueError):
+        pass
+
+    converted = []
+    for value in values:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            value = np.nan
+        elif isinstance(value, str) and seperator != ".":
+            value = value.replace(seperator, ".")
+        converted.append(value)
+
+    return np.array(converted, dtype=np.float64)
+
+
+def _to_float_block(
+    cells: list, n_cols: int, dtype: str = "float64", seperator: str = "."
+):
+    """Convert the value cells of the rows to a 2D float array.
+
+    The cells of a row are either a tuple of the values, or a single value
+    if there is only one column. The cells are converted in one call.
+    If some cells cannot be converted, e.g. None or `seperator` is not ".",
+    the columns are converted one by one with `_to_float`.
     """
+    import numpy as np
+
+    try:
+        block = np.array(cells, dtype=dtype)
+    except (TypeError, ValueError):
+        if n_cols == 1:
+            columns = [_to_float(cells, seperator)]
+        else:
+            columns = [
+                _to_float([row[i] for row in cells], seperator) for i in range(n_cols)
+            ]
+        block = np.array(columns, dtype=dtype).T
+
+    return np.asfortranarray(block.reshape(len(cells), n_cols))
 
-    if re.match(r"\d{1,2}-\d{1,2}-\d{4}", date_str):
-        date_format = "%d-%m-%Y"
-    elif re.match(r"\d{1,2}.\d{1,2}.\d{4}", date_str):
-        date_format = "%d.%m.%Y"
-    elif re.match(r"\d{4}-\d{1,2}-\d{1,2}", date_str):
-        date_format = "%Y-%m-%d"
-    elif re.match(r"\d{4}.\d{1,2}.\d{1,2}", date_str):
-        date_format = "%Y.%m.%d"
 
-    return datetime.strptime(date_str, date_format).strftime("%d-%m-%Y")
+def to_dataframe(
+    data: Iterable[dict],
+    series: str | list,
+    dtype: str = "float64",
+    seperator: str = ".",
+) -> pd.DataFrame:
+    """Convert data from the json response to pandas DataFrame.
 
+    Parameters
+    ----------
+    data:
+        Rows of the "items" in the json response. Rows are consumed
+        once, therefore an iterator decoding the response is accepted.
+    series:
+        Series keys, the value columns of the DataFrame.
+    dtype:
+        Float dtype of the value columns. The default is float64, since
+        some series, e.g. monetary aggregates, need more significant
+        digits than float32 has.
+    seperator:
+        Decimal seperator of the values in the json response.
+
+    Raises
+    ------
+    ValueError:
+        If there is no data, or a value cannot be converted to float.
+    """
+    # numpy and pandas are imported here to keep `import tcmb` light
+    import numpy as np
+    import pandas as pd
 
-def to_dataframe(data: dict, series: str | list) -> pd.DataFrame:
-    """Convert data from the json response to pandas DataFrame."""
     if isinstance(series, str):
         series = [series]
 
@@ -57,37 +292,159 @@ def to_dataframe(data: dict, series: str | list) -> pd.DataFrame:
     # the columns other than date (Tarih) and value columns will be dropped
     value_cols = [col.replace(".", "_") for col in series]
 
-    df = pd.DataFrame(data)
-    # drop unused column
-    df = df[["Tarih", *value_cols]]
-    # set date as index
+    rows = iter(data)
+    first_row = next(rows, None)
+    if first_row is None:
+        raise ValueError("No data on response, check the series and the dates.")
+
+    # detect date format from the first row, before reading the other rows
     # TODO: check if "Tarih" always the date column
-    df = df.set_index("Tarih")
-
-    # detect date format
-    if re.match(r"\d+-\d+-\d{4}", df.index[0]):
-        date_format = "%d-%m-%Y"
-    elif re.match(r"\d+-\d{4}", df.index[0]):
-        date_format = "%m-%Y"
-    elif re.match(r"\d{4}-\d+", df.index[0]):
-        date_format = "%Y-%m"
-    elif re.match(r"\d{4}", df.index[0]):
-        date_format = "%Y"
+    date_format = _detect_index_format(first_row["Tarih"])
+
+    # walk the rows once and stage the value cells row by row
+    # instead of materializing an object dtype DataFrame first
+    #   itemgetter returns a tuple of the values, or the value itself
+    #   if there is only one column
+    get_values = itemgetter(*value_cols)
+    dates = []
+    cells = []
+    for row in chain((first_row,), rows):
+        dates.append(row["Tarih"])
+        try:
+            cells.append(get_values(row))
+        except KeyError:
+            # the series keys missing in the row are read as None
+            values = tuple(row.get(col) for col in value_cols)
+            cells.append(values if len(values) > 1 else values[0])
 
     # convert date strings to datetime
-    df.index = pd.to_datetime(df.index, format=date_format)
-
-    # replace None with NaN
-    df = df.fillna(np.nan)
-    # convert object columns to float
+    parsed = _parse_daily_dates(dates) if date_format == "%d-%m-%Y" else None
+    if parsed is not None:
+        index = pd.DatetimeIndex(parsed)
+    else:
+        index = _to_datetime_cached(dates, date_format)
+    index.name = "Tarih"
+
+    # convert values to float, None is converted to NaN
+    #   all cells are converted in one call into one float block,
+    #   column major, so that the DataFrame is created without consolidating
     # TODO: convert to integer when possible
-    df = df.astype(float)
+    block = _to_float_block(cells, len(value_cols), dtype, seperator)
+    # rows with at least one value
+    has_value = ~np.isnan(block).all(axis=1)
+
     # drop rows if all missing
-    df = df.dropna(how="all")
+    if not has_value.all():
+        block = np.asfortranarray(block[has_value])
+        index = index[has_value]
+
+    df = pd.DataFrame(block, index=index, columns=value_cols, copy=False)
 
     return df
 
 
+def _expand_omitted(pattern: str) -> str:
+    """Replace omitted values with an asterisk, e.g. "TP..YTL" -> "TP.*.YTL"."""
+    while ".." in pattern:
+        pattern = pattern.replace("..", ".*.")
+
+    return pattern
+
+
+def _translate_wildcard(pattern: str) -> str:
+    """Translate a wildcard pattern to a regex pattern matching whole lines."""
+    # omitting the value has the same effect as using an asterisk
+    pattern = _expand_omitted(pattern)
+
+    # Replace the wildcard characters with a regex-friendly equivalent
+    # and escape the rest, e.g. "." is a literal dot in series keys.
+    regex = "".join(
+        ".*" if char == "*" else "." if char == "?" else re.escape(char)
+        for char in pattern
+    )
+
+    return f"^{regex}$"
+
+
+@lru_cache(maxsize=1)
+def _packed_package_series() -> str:
+    """Get the series keys in the package data as a newline separated string."""
+    series, _ = _load_series_json()
+
+    return "\n".join(series)
+
+
+@lru_cache(maxsize=1)
+def _package_series_index() -> tuple:
+    """Get the series keys in the package data with their sorted indexes.
+
+    Returns
+    -------
+    A tuple of
+    - series keys in the package data order
+    - sorted series keys and their positions
+    - sorted reversed series keys and their positions
+    """
+    series, _ = _load_series_json()
+    order = sorted(range(len(series)), key=series.__getitem__)
+    reversed_series = [item[::-1] for item in series]
+    reversed_order = sorted(range(len(series)), key=reversed_series.__getitem__)
+
+    return (
+        series,
+        [series[i] for i in order],
+        order,
+        [reversed_series[i] for i in reversed_order],
+        reversed_order,
+    )
+
+
+def _prefix_positions(keys: list, positions: list, prefix: str) -> list:
+    """Get positions of the sorted keys starting with the prefix."""
+    lo = bisect_left(keys, prefix)
+    hi = bisect_left(keys, prefix + chr(0x10FFFF), lo)
+
+    return positions[lo:hi]
+
+
+def _indexed_search(pattern: str) -> list | None:
+    """Search the package data for patterns in the form of PREFIX*SUFFIX.
+
+    Prefix and suffix are looked up in the sorted indexes, instead of
+    scanning all items. Returns None if the pattern is not in this form.
+    """
+    pattern = _expand_omitted(pattern)
+
+    if pattern.count("*") != 1 or "?" in pattern:
+        return None
+
+    prefix, suffix = pattern.split("*")
+    series, keys, order, reversed_keys, reversed_order = _package_series_index()
+
+    if not suffix:
+        positions = _prefix_positions(keys, order, prefix)
+    elif not prefix:
+        positions = _prefix_positions(reversed_keys, reversed_order, suffix[::-1])
+    else:
+        # filter the smaller one of the two candidate ranges
+        positions = min(
+            _prefix_positions(keys, order, prefix),
+            _prefix_positions(reversed_keys, reversed_order, suffix[::-1]),
+            key=len,
+        )
+        min_length = len(prefix) + len(suffix)
+        positions = [
+            i
+            for i in positions
+            if len(series[i]) >= min_length
+            and series[i].startswith(prefix)
+            and series[i].endswith(suffix)
+        ]
+
+    # keep the order of the package data
+    return [series[i] for i in sorted(positions)]
+
+
 def wildcard_search(
     pattern: str, items: list | None = None, use_package_data: bool = True
 ) -> list:
@@ -108,7 +465,7 @@ def wildcard_search(
         using the flat file in package data by using the "update" parameter.
     use_package_data:
         Whether to use package resources or fetch all series keys from
-        the TCMB database. If False, fetching may take up to 5 minutes.
+        the TCMB database. If False, fetching may take a while.
 
     Returns
     -------
@@ -127,31 +484,29 @@ def wildcard_search(
     ['TP.API.REP.TL.A12', 'TP.API.REP.TL.A23']
 
     """
-    if items is None:
-        items = []
-
-        if use_package_data:
-            file_path = os.path.join(
-                os.path.dirname(__file__), "resources", "series.json"
-            )
-
-            with open(file_path, "r") as file:
-                dg_series = json.load(file)
-
-        else:
-            dg_series = fetch_dg_series_codes()
-
-        # merge series of all datagroups into one list
-        for item in dg_series.values():
-            items.extend(item)
-
-    # Replace the wildcard characters with a regex-friendly equivalent.
-    pattern = pattern.replace("*", ".*").replace("?", ".")
+    if items is None and use_package_data:
+        # PREFIX* / *SUFFIX / PREFIX*SUFFIX patterns are looked up in the index
+        matching_items = _indexed_search(pattern)
+        if matching_items is not None:
+            return matching_items
+
+    if items is not None:
+        packed = "\n".join(items)
+    elif use_package_data:
+        packed = _packed_package_series()
+    else:
+        # merge series of all datagroups into one string
+        dg_series = fetch_dg_series_codes()
+        packed = "\n".join(code for codes in dg_series.values() for code in codes)
+
+    # an anchored pattern such as "^.*$" matches the empty string once
+    if not packed:
+        return []
 
     # Compile the regex pattern for efficiency.
-    compiled_regex = re.compile(pattern)
+    compiled_regex = re.compile(_translate_wildcard(pattern), flags=re.MULTILINE)
 
-    # Use list comprehension to find matching items.
-    matching_items = [item for item in items if compiled_regex.search(item)]
+    # Scan all items, one per line, in a single pass of the regex engine.
+    matching_items = compiled_regex.findall(packed)
 
     return matching_items
@@ -7,3 +7,12 @@ from tcmb.errors import ApiKeyError
 def test_check_api_key():
     with pytest.raises(ApiKeyError):
         auth.check_api_key()
+
+
+class MockErrorResponse:
+    status_code = 500
+    content = b"<html><head></head><body>\r\n  Service error.\r\n</body></html>"
+
+
+def test_extract_error_message():
+    assert auth._extract_error_message(MockErrorResponse()) == "Service error."
@@ -1,13 +1,22 @@
+import asyncio
+from datetime import date
+import subprocess
+import sys
+
 import pytest
 import requests
 
-from tcmb import Client
+from tcmb import Client, core
+from tcmb.errors import ApiKeyError
 
 
 # custom class to be the mock return value
-# will override the requests.Response returned from requests.get
+# will override the requests.Response returned from requests.Session.get
 class MockResponse:
     status_code = 200
+    content = b'{"mock_key": "mock_response"}'
+    text = content.decode()
+    headers: dict = {}
 
     @staticmethod
     def json():
@@ -21,12 +30,12 @@ class MockResponse:
 
 @pytest.fixture
 def mock_response(monkeypatch):
-    """Requests.get() mocked to return {'mock_key':'mock_response'}."""
+    """Session.get() mocked to return {'mock_key':'mock_response'}."""
 
     def mock_get(*args, **kwargs):
         return MockResponse()
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
 
 @pytest.fixture(autouse=True)
@@ -35,10 +44,33 @@ def no_requests(monkeypatch):
     monkeypatch.delattr("requests.sessions.Session.request")
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    """Use a temporary directory for the on-disk cache."""
+    monkeypatch.setenv("TCMB_CACHE_DIR", str(tmp_path))
+
+
 def test_client(mock_response):
     client = Client(api_key="fakekey")
 
 
+def test_client_close(mock_response, monkeypatch):
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+    with Client(api_key="fakekey") as client:
+        pass
+
+    assert closed == [client._session]
+
+
+def test_check_api_key(monkeypatch):
+    monkeypatch.delenv("TCMB_API_KEY", raising=False)
+
+    with pytest.raises(ApiKeyError):
+        core.Client()
+
+
 def test_get_response(mock_response):
     client = Client(api_key="fakekey")
     result = client._get_response(params={"mock_param_key": "mock_param_value"})
@@ -55,3 +87,112 @@ def test_datagroups(mock_response):
     client = Client(api_key="fakekey")
     result = client.datagroups
     assert result["mock_key"] == "mock_response"
+
+
+def test_metadata_is_cached(monkeypatch):
+    calls = []
+
+    def mock_get(*args, **kwargs):
+        calls.append(args)
+        return MockResponse()
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    core.clear_metadata_cache()
+
+    client = Client(api_key="fakekey")
+    first = client.get_series_metadata(series="TP.DK.USD.S.YTL")
+    second = Client(api_key="fakekey").get_series_metadata(series="TP.DK.USD.S.YTL")
+
+    # one request for each api key check, one for the metadata
+    assert len(calls) == 3
+    assert first == second
+
+
+def test_cached_metadata_is_copied(mock_response):
+    core.clear_metadata_cache()
+
+    Client(api_key="fakekey").categories["mock_key"] = "changed"
+
+    assert Client(api_key="fakekey").categories["mock_key"] == "mock_response"
+
+
+def test_read_metadata(monkeypatch):
+    class MockDataResponse(MockResponse):
+        content = (
+            b'{"items": [{"Tarih": "02-01-2024", "TP_DK_USD_S_YTL": "29.7",'
+            b' "TP_DK_EUR_S_YTL": "32.6", "UNIXTIME": {}}]}'
+        )
+
+    def mock_get(self, url, *args, **kwargs):
+        if "/serieList/" in url:
+            return MockResponse()
+        return MockDataResponse()
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    core.clear_metadata_cache()
+
+    client = Client(api_key="fakekey")
+    df = client.read("TP.DK.USD.S.YTL-TP.DK.EUR.S.YTL", metadata=True)
+
+    assert list(df.columns) == ["TP_DK_USD_S_YTL", "TP_DK_EUR_S_YTL"]
+    assert list(df.attrs) == ["TP.DK.USD.S.YTL", "TP.DK.EUR.S.YTL"]
+
+    df = asyncio.run(client.aread("TP.DK.USD.S.YTL"))
+    assert list(df.columns) == ["TP_DK_USD_S_YTL"]
+
+
+@pytest.mark.parametrize(
+    "freq, expected", [("M", 5), ("AYLIK", 5), (5, 5), (None, None)]
+)
+def test_read_freq(monkeypatch, freq, expected):
+    class MockDataResponse(MockResponse):
+        content = b'{"items": [{"Tarih": "2024-1", "TP_A": "1.5"}]}'
+
+    urls = []
+
+    def mock_get(self, url, *args, **kwargs):
+        urls.append(url)
+        return MockDataResponse()
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    core.read("TP.A", freq=freq, api_key="fakekey")
+
+    if expected is None:
+        assert "frequency=" not in urls[0]
+    else:
+        assert f"frequency={expected}" in urls[0]
+
+
+def test_read_unknown_freq():
+    with pytest.raises(ValueError):
+        core.read("TP.A", freq="m", api_key="fakekey")
+
+
+def test_today_ddmmyyyy(monkeypatch):
+    monkeypatch.setattr(core, "_TODAY_CACHE", (None, ""))
+
+    assert core._today_ddmmyyyy() == date.today().strftime("%d-%m-%Y")
+    assert core._TODAY_CACHE == (date.today(), core._today_ddmmyyyy())
+
+
+def test_import_does_not_load_pandas():
+    code = "import sys, tcmb; assert 'pandas' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_categories_reuse_api_key_check(monkeypatch):
+    calls = []
+
+    def mock_get(*args, **kwargs):
+        calls.append(args)
+        return MockResponse()
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    core.clear_metadata_cache()
+
+    client = Client(api_key="fakekey")
+    result = client.categories
+
+    assert len(calls) == 1
+    assert result["mock_key"] == "mock_response"
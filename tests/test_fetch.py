@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tcmb import _json, auth, fetch
+
+
+def test_create_uri():
+    params = {
+        "series": "TP.DK.USD.A.YTL-TP.DK.EUR.A.YTL",
+        "startDate": "01-01-2020",
+        "type": "json",
+        "formulas": None,
+        "frequency": 5,
+        "decimalSeperator": ",",
+    }
+    uri = fetch._create_uri(params=params)
+
+    assert uri == (
+        "https://evds2.tcmb.gov.tr/service/evds/"
+        "series=TP.DK.USD.A.YTL-TP.DK.EUR.A.YTL"
+        "&startDate=01-01-2020&type=json&frequency=5&decimalSeperator=,"
+    )
+
+
+def test_create_uri_endpoint_and_encoding():
+    params = {"code": "a&b c", "type": "json"}
+    uri = fetch._create_uri(params=params, endpoint="serieList")
+
+    assert uri == (
+        "https://evds2.tcmb.gov.tr/service/evds/serieList/code=a%26b%20c&type=json"
+    )
+
+
+class MockResponse:
+    content = b'{"mock_key": "mock_response"}'
+    text = content.decode()
+    url = "https://evds2.tcmb.gov.tr/service/evds/categories/type=json"
+    request = None
+
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_get_response_not_modified(monkeypatch, tmp_path):
+    monkeypatch.setenv("TCMB_CACHE_DIR", str(tmp_path))
+    request_headers = []
+
+    def mock_get(self, url, headers=None, **kwargs):
+        request_headers.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return MockResponse(status_code=304)
+        return MockResponse(headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    first = fetch.get_response(params={"type": "json"}, endpoint="categories")
+    second = fetch.get_response(params={"type": "json"}, endpoint="categories")
+
+    assert request_headers[0] is None
+    assert request_headers[1]["If-None-Match"] == '"v1"'
+    assert second.status_code == 200
+    assert fetch.parse_json(second) == fetch.parse_json(first)
+
+
+def test_write_cache_entry_threads(monkeypatch, tmp_path):
+    monkeypatch.setenv("TCMB_CACHE_DIR", str(tmp_path))
+    url = MockResponse.url
+    response = MockResponse(headers={"ETag": '"v1"'})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: fetch._write_cache_entry(url, response), range(32)))
+
+    assert fetch._read_cache_entry(url)["etag"] == '"v1"'
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_iter_items_streaming(monkeypatch):
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(_json, "STREAM_MIN_SIZE", 0)
+
+    res = MockResponse()
+    res.content = b'{"totalCount": 1, "items": [{"Tarih": "01-01-2024"}]}'
+    auth.check_status(res)
+
+    assert not hasattr(res, "_parsed")
+    assert list(fetch.iter_items(res)) == [{"Tarih": "01-01-2024"}]
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from tcmb import utils
 
 import pytest
@@ -8,6 +10,8 @@ test_date_data = [
     ("17.12.2009", "17-12-2009"),
     ("2011-06-18", "18-06-2011"),
     ("2018.04.10", "10-04-2018"),
+    ("12-1-2024", "12-01-2024"),
+    ("2024.1.5", "05-01-2024"),
 ]
 
 
@@ -18,6 +22,30 @@ def test_standardize_date(date_str, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize("date_str", ["17/12/2009", "2011-06.18", "31-02-2024"])
+def test_standardize_date_invalid(date_str):
+    with pytest.raises(ValueError):
+        utils.standardize_date(date_str)
+
+
+test_index_date_data = [
+    ("02-01-2024", "%d-%m-%Y"),
+    ("1-2024", "%m-%Y"),
+    ("2024-1", "%Y-%m"),
+    ("2024", "%Y"),
+]
+
+
+@pytest.mark.parametrize("date_str, expected", test_index_date_data)
+def test_detect_index_format(date_str, expected):
+    assert utils._detect_index_format(date_str) == expected
+
+
+def test_detect_index_format_unknown():
+    with pytest.raises(ValueError):
+        utils._detect_index_format("2024-Q1")
+
+
 def test_wildcard_search():
     items_expected = [
         "TP.API.REP.TL.A12",
@@ -29,3 +57,154 @@ def test_wildcard_search():
     items = utils.wildcard_search("TP.API.REP.TL.*")
 
     assert all(item in items_expected for item in items)
+
+
+def test_to_dataframe():
+    data = [
+        {"Tarih": "02-01-2024", "TP_DK_USD_S_YTL": "29.7", "UNIXTIME": {}},
+        {"Tarih": "03-01-2024", "TP_DK_USD_S_YTL": None, "UNIXTIME": {}},
+        {"Tarih": "04-01-2024", "TP_DK_USD_S_YTL": "29.9", "UNIXTIME": {}},
+    ]
+    df = utils.to_dataframe(data, series="TP.DK.USD.S.YTL")
+
+    assert list(df.columns) == ["TP_DK_USD_S_YTL"]
+    assert df.index.name == "Tarih"
+    assert str(df.index[0].date()) == "2024-01-02"
+    assert df["TP_DK_USD_S_YTL"].dtype == "float64"
+    # rows with all missing values are dropped
+    assert len(df) == 2
+
+
+def test_parse_daily_dates():
+    result = utils._parse_daily_dates(["02-01-2024", "29-02-2024", "31-12-1999"])
+
+    assert [str(d)[:10] for d in result] == ["2024-01-02", "2024-02-29", "1999-12-31"]
+
+
+@pytest.mark.parametrize("date_str", ["30-02-2024", "01-13-2024", "2-01-2024"])
+def test_parse_daily_dates_fallback(date_str):
+    assert utils._parse_daily_dates(["02-01-2024", date_str]) is None
+
+
+def test_to_datetime_cached():
+    dates = ["2023-1", "2023-2", "2023-1"]
+    first = utils._to_datetime_cached(dates, "%Y-%m")
+
+    assert ("%Y-%m", "2023-2") in utils._DATE_CACHE
+    assert [str(d)[:10] for d in first] == ["2023-01-01", "2023-02-01", "2023-01-01"]
+    assert utils._to_datetime_cached(dates, "%Y-%m").equals(first)
+
+
+def test_to_datetime_cached_threads(monkeypatch):
+    monkeypatch.setattr(utils, "_DATE_CACHE", {})
+    monkeypatch.setattr(utils, "_DATE_CACHE_MAXSIZE", 4)
+    years = range(2000, 2016)
+    dates = [[f"{year}-{month}" for month in range(1, 13)] for year in years]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(utils._to_datetime_cached, dates, ["%Y-%m"] * 16))
+
+    assert [index[0].year for index in results] == list(years)
+    assert len(utils._DATE_CACHE) <= 4
+
+
+def test_to_dataframe_empty():
+    with pytest.raises(ValueError):
+        utils.to_dataframe([], series="TP.A")
+
+
+def test_to_dataframe_none_values():
+    data = [
+        {"Tarih": "2023-1", "TP_A": None, "TP_B": "1.5"},
+        {"Tarih": "2023-2", "TP_A": "2.5", "TP_B": None},
+    ]
+    df = utils.to_dataframe(data, series=["TP.A", "TP.B"])
+
+    assert df.dtypes.tolist() == ["float64", "float64"]
+    assert df.isna().to_numpy().tolist() == [[True, False], [False, True]]
+
+
+def test_to_dataframe_dtype():
+    data = [
+        {"Tarih": "2024", "TP_A": "1.5", "TP_B": "2.5"},
+        {"Tarih": "2025", "TP_A": None, "TP_B": "3.5"},
+    ]
+    df = utils.to_dataframe(data, series=["TP.A", "TP.B"], dtype="float32")
+
+    assert df.dtypes.tolist() == ["float32", "float32"]
+    assert df["TP_A"].isna().tolist() == [False, True]
+
+
+@pytest.mark.parametrize("series", [["TP.A"], ["TP.A", "TP.B"]])
+def test_to_dataframe_missing_keys(series):
+    data = [
+        {"Tarih": "02-01-2024", "TP_A": "1.5", "TP_B": "2.5"},
+        {"Tarih": "03-01-2024"},
+        {"Tarih": "04-01-2024", "TP_A": "3.5"},
+    ]
+    df = utils.to_dataframe(data, series=series)
+
+    assert df.index.strftime("%d-%m-%Y").tolist() == ["02-01-2024", "04-01-2024"]
+    assert df["TP_A"].tolist() == [1.5, 3.5]
+
+
+def test_to_dataframe_non_numeric_values():
+    data = [
+        {"Tarih": "2023", "TP_A": "1.5", "TP_B": ""},
+        {"Tarih": "2024", "TP_A": "2.5", "TP_B": "3.5"},
+    ]
+    df = utils.to_dataframe(data, series=["TP.A", "TP.B"])
+
+    assert df["TP_B"].isna().tolist() == [True, False]
+
+
+def test_to_dataframe_seperator():
+    data = [
+        {"Tarih": "02-01-2024", "TP_A": "1,5", "TP_B": None},
+        {"Tarih": "03-01-2024", "TP_A": "29,7", "TP_B": "3,25"},
+    ]
+    df = utils.to_dataframe(data, series=["TP.A", "TP.B"], seperator=",")
+
+    assert df["TP_A"].tolist() == [1.5, 29.7]
+    assert df["TP_B"].tolist()[1] == 3.25
+
+
+def test_to_dataframe_invalid_values():
+    data = [
+        {"Tarih": "02-01-2024", "TP_A": "1,5"},
+        {"Tarih": "03-01-2024", "TP_A": "2,5"},
+    ]
+
+    with pytest.raises(ValueError):
+        utils.to_dataframe(data, series="TP.A")
+
+
+test_wildcard_data = [
+    ("TP.API.REP.TL.A??", ["TP.API.REP.TL.A12", "TP.API.REP.TL.A23"]),
+    ("TP.API.REP.TL.A*", ["TP.API.REP.TL.A12", "TP.API.REP.TL.A23"]),
+    ("TP.API.REP..A12", ["TP.API.REP.ORT.A12", "TP.API.REP.TL.A12"]),
+    # "." is a literal dot, not any character
+    ("TP.API.REP.TL.A1.", []),
+]
+
+
+test_wildcard_items = [
+    "TP.API.REP.ORT.A12",
+    "TP.API.REP.TL.A12",
+    "TP.API.REP.TL.A23",
+    "TP.API.REP.TL.G1",
+    "TP.API.REP.TL.G1530",
+]
+
+
+@pytest.mark.parametrize(
+    "pattern, items, expected",
+    [
+        (pattern, test_wildcard_items, expected)
+        for pattern, expected in test_wildcard_data
+    ]
+    # no items, no matches
+    + [("*", [], []), ("", [], [])],
+)
+def test_wildcard_search_items(pattern, items, expected):
+    assert utils.wildcard_search(pattern, items=items) == expected